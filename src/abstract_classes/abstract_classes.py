@@ -11,6 +11,10 @@ class AbstractDBManager(ABC):
     def get_all_vacancies(self) -> List[Dict[str, Any]]:
         """Получает список всех вакансий с указанием названия компании, названия вакансии и зарплаты и ссылки на вакансию."""
 
+    @abstractmethod
+    def get_vacancies_page(self, limit: int, offset: int) -> Dict[str, Any]:
+        """Получает страницу списка вакансий (items) и общее количество вакансий (total)."""
+
     @abstractmethod
     def get_avg_salary(self) -> float:
         """Получает среднюю зарплату по вакансиям."""
@@ -7,8 +7,15 @@ from src.vacancies.vacancy import SalaryRange
 
 
 class DBManager(AbstractDBManager):
-    def __init__(self):
-        self.conn = self.connect_to_db()
+    def __init__(self, conn=None):
+        """
+        Инициализирует DBManager.
+
+        Args:
+            conn: Готовое соединение (например, из пула). Если не передано,
+                открывается новое соединение с базой данных.
+        """
+        self.conn = conn if conn is not None else self.connect_to_db()
 
     @classmethod
     def initialize_database(cls):
@@ -129,6 +136,49 @@ class DBManager(AbstractDBManager):
                 for row in cur.fetchall()
             ]
 
+    def get_vacancies_page(self, limit: int, offset: int) -> Dict[str, Any]:
+        """Получает одну страницу списка вакансий и общее количество вакансий."""
+        with self.conn.cursor() as cur:
+            # COUNT(*) OVER () считается в том же запросе, что и страница,
+            # поэтому total всегда согласован с items
+            cur.execute(
+                """
+                SELECT companies.name, vacancies.name, vacancies.salary_from, vacancies.salary_to, vacancies.url,
+                       COUNT(*) OVER ()
+                FROM vacancies
+                JOIN companies ON companies.id = vacancies.company_id
+                ORDER BY vacancies.id
+                LIMIT %s OFFSET %s
+            """,
+                (limit, offset),
+            )
+            rows = cur.fetchall()
+            if rows:
+                total = rows[0][5]
+            else:
+                # Страница за пределами списка: количество считаем отдельно
+                cur.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM vacancies
+                    JOIN companies ON companies.id = vacancies.company_id
+                """
+                )
+                total = cur.fetchone()[0]
+            return {
+                "total": total,
+                "items": [
+                    {
+                        "company": row[0],
+                        "vacancy": row[1],
+                        "salary_from": row[2],
+                        "salary_to": row[3],
+                        "url": row[4],
+                    }
+                    for row in rows
+                ],
+            }
+
     def get_avg_salary(self) -> float:
         with self.conn.cursor() as cur:
             cur.execute(
@@ -0,0 +1,490 @@
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+from src.config import DB_HOST, DB_NAME, DB_PASSWORD, DB_PORT, DB_USER
+from src.database.db_manager import DBManager
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+MAX_CACHE_ENTRIES = 1024
+MAX_HEADER_LINES = 100
+MAX_BODY_SIZE = 1024
+KEEP_ALIVE_TIMEOUT = 15.0
+
+STATUS_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def _env_number(name: str, default: str, cast: Callable[[str], Any], minimum: float):
+    """Читает числовую настройку сервиса из переменной окружения."""
+    raw = os.getenv(name, default).strip()
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = None
+    # nan и inf для float проходят сравнение, но ломают расчет max-age
+    if value is None or not math.isfinite(value) or value < minimum:
+        raise ValueError(
+            f"Некорректное значение переменной окружения {name}: {raw!r} "
+            f"(ожидается конечное число не меньше {minimum})."
+        )
+    return value
+
+
+# Настройки локального HTTP-сервиса (переменные окружения или .env)
+API_HOST = os.getenv("API_HOST", "127.0.0.1").strip()
+API_PORT = _env_number("API_PORT", "8080", int, 0)
+API_POOL_SIZE = _env_number("API_POOL_SIZE", "10", int, 1)
+API_CACHE_TTL = _env_number("API_CACHE_TTL", "5", float, 0)
+
+
+class BadRequest(ValueError):
+    """Некорректные параметры запроса к сервису."""
+
+
+class EncodedBody(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    Кэш готовых JSON-ответов с ограниченным временем жизни.
+
+    Одновременные запросы с одним ключом ожидают один и тот же запрос к базе,
+    поэтому при наплыве клиентов в базу уходит только один запрос на ключ.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = MAX_CACHE_ENTRIES):
+        """
+        Инициализирует кэш.
+
+        Args:
+            ttl (float): Время жизни записи в секундах.
+            max_entries (int): Максимальное количество записей.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[str, CachedResponse] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[EncodedBody]]
+    ) -> CachedResponse:
+        """
+        Возвращает ответ из кэша или вычисляет его.
+
+        Args:
+            key (str): Ключ кэша.
+            compute (Callable[[], Awaitable[EncodedBody]]): Корутина, возвращающая
+                готовое тело ответа и его ETag.
+
+        Returns:
+            CachedResponse: Тело ответа, его ETag и время истечения.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > loop.time():
+            return entry
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, compute))
+            self._pending[key] = task
+        # shield: отключение одного клиента не отменяет общий запрос к базе
+        return await asyncio.shield(task)
+
+    async def _fill(
+        self, key: str, compute: Callable[[], Awaitable[EncodedBody]]
+    ) -> CachedResponse:
+        try:
+            body, etag = await compute()
+            expires_at = asyncio.get_running_loop().time() + self.ttl
+            entry = CachedResponse(body, etag, expires_at)
+            self._store(key, entry)
+            return entry
+        finally:
+            self._pending.pop(key, None)
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = entry
+        if len(self._entries) > self.max_entries:
+            now = asyncio.get_running_loop().time()
+            for stale_key in [
+                k for k, v in self._entries.items() if v.expires_at <= now
+            ]:
+                del self._entries[stale_key]
+            # Если устаревших записей не нашлось, вытесняем самые старые
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+
+class QueryService:
+    """
+    Асинхронный HTTP-сервис, отдающий результаты запросов DBManager в формате JSON.
+
+    Запросы к базе выполняются в пуле потоков, каждый поток берет соединение
+    из общего пула соединений psycopg2.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = API_POOL_SIZE,
+        cache_ttl: float = API_CACHE_TTL,
+        db_params: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Инициализирует сервис.
+
+        Args:
+            pool_size (int): Максимальное количество соединений с базой данных.
+            cache_ttl (float): Время жизни закэшированных ответов в секундах.
+            db_params (Optional[Dict[str, str]]): Параметры подключения к базе данных.
+                По умолчанию берутся из src.config.
+        """
+        self.pool_size = pool_size
+        self.db_params = db_params or {
+            "dbname": DB_NAME,
+            "user": DB_USER,
+            "password": DB_PASSWORD,
+            "host": DB_HOST,
+            "port": DB_PORT,
+        }
+        self.cache = ResponseCache(cache_ttl)
+        self.pool: Optional[ThreadedConnectionPool] = None
+        # Потоков не больше, чем соединений: пул psycopg2 не ждет, а падает при исчерпании
+        self.executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="db"
+        )
+        self.routes: Dict[
+            str, Callable[[Dict[str, List[str]]], Tuple[str, Callable]]
+        ] = {
+            "/companies": self._companies,
+            "/vacancies": self._vacancies,
+            "/vacancies/average-salary": self._avg_salary,
+            "/vacancies/higher-salary": self._higher_salary,
+            "/vacancies/search": self._search,
+        }
+
+    def open_pool(self) -> None:
+        """Создает пул соединений с базой данных."""
+        try:
+            # minconn = maxconn: иначе putconn закрывает "лишние" свободные соединения,
+            # и следующий getconn заново подключается к базе под блокировкой пула
+            self.pool = ThreadedConnectionPool(
+                self.pool_size, self.pool_size, **self.db_params
+            )
+            logging.info(
+                f"Создан пул из {self.pool_size} соединений к {self.db_params['dbname']}."
+            )
+        except psycopg2.Error as e:
+            logging.error(f"Не удалось создать пул соединений: {e}")
+            raise
+
+    def close(self) -> None:
+        """Останавливает пул потоков и закрывает все соединения."""
+        self.executor.shutdown(wait=True)
+        if self.pool is not None:
+            self.pool.closeall()
+            self.pool = None
+
+    def _run_query(self, fetch: Callable[[DBManager], Any]) -> EncodedBody:
+        """
+        Выполняет запрос на соединении из пула и кодирует результат (в рабочем потоке).
+
+        Сериализация и подсчет ETag тоже выполняются здесь, чтобы большие ответы
+        не блокировали цикл событий.
+        """
+        conn = self.pool.getconn()
+        try:
+            # Сервис только читает данные, транзакции ему не нужны
+            if not conn.autocommit:
+                conn.autocommit = True
+            data = fetch(DBManager(conn))
+        finally:
+            self.pool.putconn(conn)
+        return _encode(data)
+
+    async def _query(self, fetch: Callable[[DBManager], Any]) -> EncodedBody:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._run_query, fetch)
+
+    # Обработчики маршрутов возвращают ключ кэша и функцию, получающую данные из DBManager
+
+    def _companies(self, params: Dict[str, List[str]]) -> Tuple[str, Callable]:
+        return "companies", lambda db: db.get_companies_and_vacancies_count()
+
+    def _vacancies(self, params: Dict[str, List[str]]) -> Tuple[str, Callable]:
+        limit = _int_param(params, "limit", DEFAULT_PAGE_LIMIT, 1, MAX_PAGE_LIMIT)
+        offset = _int_param(params, "offset", 0, 0, None)
+
+        def fetch(db: DBManager) -> Dict[str, Any]:
+            page = db.get_vacancies_page(limit, offset)
+            return {
+                "total": page["total"],
+                "limit": limit,
+                "offset": offset,
+                "items": page["items"],
+            }
+
+        return f"vacancies:{limit}:{offset}", fetch
+
+    def _avg_salary(self, params: Dict[str, List[str]]) -> Tuple[str, Callable]:
+        return "avg_salary", lambda db: {"avg_salary": db.get_avg_salary()}
+
+    def _higher_salary(self, params: Dict[str, List[str]]) -> Tuple[str, Callable]:
+        return "higher_salary", lambda db: db.get_vacancies_with_higher_salary()
+
+    def _search(self, params: Dict[str, List[str]]) -> Tuple[str, Callable]:
+        keyword = params.get("keyword", [""])[0].strip()
+        if not keyword:
+            raise BadRequest("Параметр keyword обязателен.")
+        return (
+            f"search:{keyword.lower()}",
+            lambda db: db.get_vacancies_with_keyword(keyword),
+        )
+
+    async def dispatch(
+        self, method: str, target: str, headers: Dict[str, str]
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """
+        Обрабатывает один HTTP-запрос.
+
+        Args:
+            method (str): HTTP-метод.
+            target (str): Путь запроса вместе со строкой параметров.
+            headers (Dict[str, str]): Заголовки запроса (имена в нижнем регистре).
+
+        Returns:
+            Tuple[int, bytes, Dict[str, str]]: Код ответа, тело и дополнительные заголовки.
+        """
+        url = urlsplit(target)
+        route = self.routes.get(url.path.rstrip("/") or "/")
+        if route is None:
+            return _error(404, "Неизвестный адрес.")
+        if method not in ("GET", "HEAD"):
+            status, body, extra = _error(405, "Поддерживаются только GET и HEAD.")
+            extra["Allow"] = "GET, HEAD"
+            return status, body, extra
+
+        try:
+            key, fetch = route(parse_qs(url.query))
+            entry = await self.cache.get_or_compute(key, lambda: self._query(fetch))
+        except BadRequest as e:
+            return _error(400, str(e))
+        except psycopg2.Error as e:
+            logging.error(f"Ошибка при выполнении запроса {url.path}: {e}")
+            return _error(503, "База данных недоступна.")
+
+        ttl_left = max(0, int(entry.expires_at - asyncio.get_running_loop().time()))
+        extra = {"ETag": entry.etag, "Cache-Control": f"max-age={ttl_left}"}
+        if _etag_matches(headers.get("if-none-match"), entry.etag):
+            return 304, b"", extra
+        return 200, entry.body, extra
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Обслуживает одно TCP-соединение (с поддержкой keep-alive)."""
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except BadRequest:
+                    raise
+                except ValueError:
+                    # StreamReader.readline: строка длиннее лимита буфера
+                    raise BadRequest("Слишком длинная строка запроса.")
+                if request is None:
+                    break
+                method, target, version, headers = request
+                status, body, extra = await self.dispatch(method, target, headers)
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = (
+                    connection != "close"
+                    if version == "HTTP/1.1"
+                    else connection == "keep-alive"
+                )
+                writer.write(
+                    _render_response(
+                        status, body, extra, keep_alive, send_body=method != "HEAD"
+                    )
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except BadRequest as e:
+            writer.write(_render_response(*_error(400, str(e)), keep_alive=False))
+        except Exception:
+            logging.exception("Необработанная ошибка при обработке запроса")
+            writer.write(
+                _render_response(
+                    *_error(500, "Внутренняя ошибка сервиса."), keep_alive=False
+                )
+            )
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host: str = API_HOST, port: int = API_PORT) -> None:
+        """Запускает HTTP-сервер и обслуживает запросы до остановки."""
+        self.open_pool()
+        try:
+            server = await asyncio.start_server(
+                self.handle_client, host, port, backlog=1024
+            )
+            logging.info(f"Сервис запросов доступен на http://{host}:{port}")
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+
+def _int_param(
+    params: Dict[str, List[str]],
+    name: str,
+    default: int,
+    minimum: int,
+    maximum: Optional[int],
+) -> int:
+    """Читает целочисленный параметр запроса и проверяет его границы."""
+    raw = params.get(name)
+    if not raw:
+        return default
+    try:
+        value = int(raw[0])
+    except ValueError:
+        raise BadRequest(f"Параметр {name} должен быть целым числом.")
+    if value < minimum or (maximum is not None and value > maximum):
+        upper = f" и не больше {maximum}" if maximum is not None else ""
+        raise BadRequest(f"Параметр {name} должен быть не меньше {minimum}{upper}.")
+    return value
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def _encode(data: Any) -> EncodedBody:
+    """Сериализует данные в JSON и вычисляет ETag тела ответа."""
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    return EncodedBody(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+
+def _error(status: int, message: str) -> Tuple[int, bytes, Dict[str, str]]:
+    body = json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+    return status, body, {"Cache-Control": "no-store"}
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, str, str, Dict[str, str]]]:
+    """
+    Читает строку запроса и заголовки.
+
+    Returns:
+        Optional[Tuple[str, str, str, Dict[str, str]]]: Метод, путь, версия протокола
+        и заголовки либо None, если клиент закрыл соединение.
+
+    Raises:
+        BadRequest: Если запрос не удалось разобрать.
+    """
+    line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+    if not line.strip():
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise BadRequest("Некорректная строка запроса.")
+    method, target, version = parts
+
+    headers: Dict[str, str] = {}
+    for _ in range(MAX_HEADER_LINES):
+        header_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+        if header_line in (b"\r\n", b"\n", b""):
+            break
+        name, separator, value = header_line.decode("latin-1").partition(":")
+        if not separator:
+            raise BadRequest("Некорректный заголовок запроса.")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise BadRequest("Слишком много заголовков.")
+
+    # Без поддержки chunked тело нельзя отделить от следующего запроса
+    if "transfer-encoding" in headers:
+        raise BadRequest("Transfer-Encoding не поддерживается.")
+    try:
+        length = int(headers.get("content-length", "0") or 0)
+    except ValueError:
+        raise BadRequest("Некорректный Content-Length.")
+    if length < 0 or length > MAX_BODY_SIZE:
+        raise BadRequest("Некорректный Content-Length.")
+    # Тело запроса сервису не нужно, но его нужно вычитать для keep-alive
+    if length:
+        await asyncio.wait_for(reader.readexactly(length), KEEP_ALIVE_TIMEOUT)
+    return method.upper(), target, version, headers
+
+
+def _render_response(
+    status: int,
+    body: bytes,
+    extra_headers: Dict[str, str],
+    keep_alive: bool,
+    send_body: bool = True,
+) -> bytes:
+    lines = [f"HTTP/1.1 {status} {STATUS_REASONS[status]}"]
+    # У 304 нет тела; Content-Length: 0 кэш принял бы за длину сохраненного ответа
+    if status != 304:
+        lines.append("Content-Type: application/json; charset=utf-8")
+        lines.append(f"Content-Length: {len(body)}")
+    lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    lines.extend(f"{name}: {value}" for name, value in extra_headers.items())
+    head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+    return head + body if send_body else head
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    service = QueryService()
+    try:
+        asyncio.run(service.serve())
+    except KeyboardInterrupt:
+        print("Сервис остановлен.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# src.config требует параметры подключения при импорте; для тестов без базы
+# подойдут любые значения
+for _name in ("DB_NAME", "DB_USER", "DB_PASSWORD", "DB_HOST", "DB_PORT"):
+    os.environ.setdefault(_name, "test")
+
+
+@pytest.fixture
+def pg_params():
+    """
+    Параметры подключения к тестовой базе PostgreSQL.
+
+    Тесты с этой фикстурой пропускаются, если не задана переменная TEST_DB_NAME.
+    Таблицы в тестовой базе удаляются после каждого теста, поэтому тестовая база
+    не может совпадать с основной (DB_NAME).
+    """
+    db_name = os.getenv("TEST_DB_NAME", "").strip()
+    if not db_name:
+        pytest.skip("TEST_DB_NAME не задана, тесты с PostgreSQL пропущены")
+    if db_name == os.environ["DB_NAME"].strip():
+        pytest.fail(
+            "TEST_DB_NAME совпадает с DB_NAME: тесты удаляют таблицы, "
+            "укажите отдельную тестовую базу"
+        )
+    return {
+        "dbname": db_name,
+        "user": os.environ["DB_USER"],
+        "password": os.environ["DB_PASSWORD"],
+        "host": os.environ["DB_HOST"],
+        "port": os.environ["DB_PORT"],
+    }
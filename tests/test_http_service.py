@@ -0,0 +1,352 @@
+import asyncio
+import json
+
+import psycopg2
+import pytest
+
+from src.service import http_service
+from src.service.http_service import (
+    BadRequest,
+    QueryService,
+    ResponseCache,
+    _env_number,
+    _etag_matches,
+    _int_param,
+    _read_request,
+)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def encoded(data):
+    return http_service._encode(data)
+
+
+class FakeDBManager:
+    calls = []
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get_companies_and_vacancies_count(self):
+        self.calls.append("companies")
+        return [{"company": "Яндекс", "vacancy_count": 2}]
+
+    def get_vacancies_page(self, limit, offset):
+        self.calls.append(("page", limit, offset))
+        return {"total": 2, "items": [{"vacancy": "Python"}][:limit]}
+
+    def get_avg_salary(self):
+        raise psycopg2.OperationalError("server closed the connection")
+
+
+class FakeConn:
+    autocommit = False
+
+
+class FakePool:
+    def __init__(self):
+        self.returned = 0
+
+    def getconn(self):
+        return FakeConn()
+
+    def putconn(self, conn):
+        self.returned += 1
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(http_service, "DBManager", FakeDBManager)
+    FakeDBManager.calls = []
+    service = QueryService(pool_size=2, cache_ttl=60)
+    service.pool = FakePool()
+    yield service
+    service.executor.shutdown(wait=True)
+
+
+def feed(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+# ResponseCache
+
+
+def test_cache_returns_entry_until_ttl_expires():
+    async def scenario():
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return encoded(len(calls))
+
+        fresh = ResponseCache(ttl=60)
+        first = await fresh.get_or_compute("key", compute)
+        second = await fresh.get_or_compute("key", compute)
+        assert first is second
+
+        expired = ResponseCache(ttl=0)
+        await expired.get_or_compute("key", compute)
+        again = await expired.get_or_compute("key", compute)
+        assert json.loads(again.body) == 3
+        assert len(calls) == 3
+
+    run(scenario())
+
+
+def test_cache_evicts_oldest_entries():
+    async def scenario():
+        cache = ResponseCache(ttl=60, max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.get_or_compute(key, lambda: _async(encoded(key)))
+        assert list(cache._entries) == ["b", "c"]
+
+    run(scenario())
+
+
+def test_cache_shares_one_computation_between_concurrent_requests():
+    async def scenario():
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return encoded("data")
+
+        cache = ResponseCache(ttl=60)
+        results = await asyncio.gather(
+            *[cache.get_or_compute("key", compute) for _ in range(50)]
+        )
+        assert len(calls) == 1
+        assert len({result.etag for result in results}) == 1
+        assert not cache._pending
+
+    run(scenario())
+
+
+def test_cache_does_not_store_failed_computation():
+    async def scenario():
+        async def fail():
+            raise psycopg2.OperationalError("down")
+
+        cache = ResponseCache(ttl=60)
+        with pytest.raises(psycopg2.OperationalError):
+            await cache.get_or_compute("key", fail)
+        assert not cache._entries
+        assert not cache._pending
+
+    run(scenario())
+
+
+async def _async(value):
+    return value
+
+
+# Вспомогательные функции
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('"other"', False),
+        ("*", True),
+        ('W/"abc"', True),
+        ('"one", W/"abc" , "two"', True),
+        ('"one", "two"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert _etag_matches(header, '"abc"') is expected
+
+
+def test_int_param_bounds():
+    assert _int_param({}, "limit", 50, 1, 500) == 50
+    assert _int_param({"limit": ["1"]}, "limit", 50, 1, 500) == 1
+    assert _int_param({"limit": ["500"]}, "limit", 50, 1, 500) == 500
+    assert _int_param({"offset": ["100000"]}, "offset", 0, 0, None) == 100000
+    for raw in ("0", "501", "abc", "1.5"):
+        with pytest.raises(BadRequest):
+            _int_param({"limit": [raw]}, "limit", 50, 1, 500)
+    with pytest.raises(BadRequest):
+        _int_param({"offset": ["-1"]}, "offset", 0, 0, None)
+
+
+@pytest.mark.parametrize("raw", ["abc", "-1", "nan", "inf", "-inf"])
+def test_env_number_rejects_invalid_values(monkeypatch, raw):
+    monkeypatch.setenv("API_CACHE_TTL", raw)
+    with pytest.raises(ValueError):
+        _env_number("API_CACHE_TTL", "5", float, 0)
+
+
+def test_env_number_uses_default(monkeypatch):
+    monkeypatch.delenv("API_CACHE_TTL", raising=False)
+    assert _env_number("API_CACHE_TTL", "5", float, 0) == 5.0
+
+
+# QueryService.dispatch
+
+
+def test_dispatch_ok_and_not_modified(service):
+    async def scenario():
+        status, body, headers = await service.dispatch("GET", "/companies", {})
+        assert status == 200
+        assert json.loads(body) == [{"company": "Яндекс", "vacancy_count": 2}]
+        assert headers["Cache-Control"].startswith("max-age=")
+
+        status, body, _ = await service.dispatch(
+            "GET", "/companies/", {"if-none-match": headers["ETag"]}
+        )
+        assert status == 304
+        assert body == b""
+        assert FakeDBManager.calls == ["companies"]
+        assert service.pool.returned == 1
+
+    run(scenario())
+
+
+def test_dispatch_paginates_vacancies(service):
+    async def scenario():
+        status, body, _ = await service.dispatch(
+            "GET", "/vacancies?limit=1&offset=1", {}
+        )
+        assert status == 200
+        assert json.loads(body) == {
+            "total": 2,
+            "limit": 1,
+            "offset": 1,
+            "items": [{"vacancy": "Python"}],
+        }
+        assert FakeDBManager.calls == [("page", 1, 1)]
+
+    run(scenario())
+
+
+@pytest.mark.parametrize(
+    "method, target, status",
+    [
+        ("GET", "/vacancies?limit=0", 400),
+        ("GET", "/vacancies/search", 400),
+        ("GET", "/vacancies/search?keyword=%20", 400),
+        ("GET", "/unknown", 404),
+        ("POST", "/companies", 405),
+        ("GET", "/vacancies/average-salary", 503),
+    ],
+)
+def test_dispatch_errors(service, method, target, status):
+    result_status, body, headers = run(service.dispatch(method, target, {}))
+    assert result_status == status
+    assert "error" in json.loads(body)
+    assert headers["Cache-Control"] == "no-store"
+    if status == 405:
+        assert headers["Allow"] == "GET, HEAD"
+
+
+# Разбор запросов
+
+
+def test_read_request_keep_alive():
+    async def scenario():
+        reader = feed(
+            b"GET /companies HTTP/1.1\r\nHost: x\r\nContent-Length: 4\r\n\r\nbody"
+            b"head /vacancies HTTP/1.1\r\nConnection: close\r\n\r\n"
+        )
+        first = await _read_request(reader)
+        second = await _read_request(reader)
+        third = await _read_request(reader)
+        assert first[:3] == ("GET", "/companies", "HTTP/1.1")
+        assert first[3]["host"] == "x"
+        assert second == (
+            "HEAD",
+            "/vacancies",
+            "HTTP/1.1",
+            {"connection": "close"},
+        )
+        assert third is None
+
+    run(scenario())
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"GARBAGE\r\n\r\n",
+        b"GET / HTTP/1.1\r\nno colon\r\n\r\n",
+        b"GET / HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+        b"GET / HTTP/1.1\r\nContent-Length: -1\r\n\r\n",
+        b"GET / HTTP/1.1\r\nContent-Length: 1000000\r\n\r\n",
+        b"GET / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n",
+        b"GET / HTTP/1.1\r\n" + b"X: y\r\n" * 200 + b"\r\n",
+    ],
+)
+def test_read_request_rejects_malformed(raw):
+    async def scenario():
+        with pytest.raises(BadRequest):
+            await _read_request(feed(raw))
+
+    run(scenario())
+
+
+def exchange(service, raw: bytes) -> bytes:
+    """Отправляет сырой запрос запущенному сервису и возвращает весь ответ."""
+
+    async def scenario():
+        server = await asyncio.start_server(service.handle_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        return response
+
+    return run(scenario())
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b"GARBAGE\r\n\r\n", b"GET /" + b"a" * 100000 + b" HTTP/1.1\r\n\r\n"],
+)
+def test_malformed_request_gets_400_response(service, raw):
+    response = exchange(service, raw)
+    assert response.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    assert b"Connection: close" in response
+
+
+def test_unexpected_error_gets_500_response(service, monkeypatch):
+    async def broken(method, target, headers):
+        raise ValueError("cannot convert float NaN to integer")
+
+    monkeypatch.setattr(service, "dispatch", broken)
+    response = exchange(service, b"GET /companies HTTP/1.1\r\n\r\n")
+    assert response.startswith(b"HTTP/1.1 500 Internal Server Error\r\n")
+    assert b"Connection: close" in response
+
+
+def test_not_modified_response_has_no_content_headers(service):
+    response = exchange(
+        service, b"GET /companies HTTP/1.1\r\nConnection: close\r\n\r\n"
+    )
+    head = response.split(b"\r\n\r\n", 1)[0].decode()
+    etag = [line for line in head.split("\r\n") if line.startswith("ETag: ")][0]
+
+    response = exchange(
+        service,
+        f"GET /companies HTTP/1.1\r\nIf-None-Match: {etag[6:]}\r\n"
+        f"Connection: close\r\n\r\n".encode(),
+    )
+    head, _, body = response.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    assert lines[0] == "HTTP/1.1 304 Not Modified"
+    names = {line.split(":", 1)[0].lower() for line in lines[1:]}
+    assert "content-length" not in names
+    assert "content-type" not in names
+    assert {"etag", "cache-control"} <= names
+    assert body == b""
@@ -0,0 +1,130 @@
+"""
+Тесты DBManager и HTTP-сервиса на локальной PostgreSQL.
+
+Запускаются, если задана переменная окружения TEST_DB_NAME с именем отдельной
+тестовой базы (остальные параметры подключения берутся из DB_USER, DB_PASSWORD,
+DB_HOST, DB_PORT). Таблицы в этой базе удаляются после каждого теста.
+"""
+
+import asyncio
+import json
+
+import psycopg2
+import pytest
+
+from src.database.db_manager import DBManager
+from src.service.http_service import QueryService
+from src.vacancies.vacancy import SalaryRange
+
+VACANCIES = [
+    ("Яндекс", "1", "Python developer", SalaryRange(100000, 200000)),
+    ("Яндекс", "2", "Java developer", SalaryRange(50000, None)),
+    ("Яндекс", "3", "Python QA", None),
+    ("Ozon", "4", "Go developer", SalaryRange(300000, 300000)),
+]
+
+
+@pytest.fixture
+def db(pg_params):
+    conn = psycopg2.connect(**pg_params)
+    manager = DBManager(conn)
+    manager.create_tables()
+    for company, hh_id, name, salary in VACANCIES:
+        manager.insert_vacancy(
+            company_id=manager.insert_company(company),
+            hh_vacancy_id=hh_id,
+            name=name,
+            salary=salary,
+            url=f"https://hh.ru/vacancy/{hh_id}",
+        )
+    yield manager
+    conn.rollback()
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS vacancies, companies")
+    conn.commit()
+    conn.close()
+
+
+def test_get_vacancies_page(db):
+    page = db.get_vacancies_page(2, 1)
+    assert page["total"] == 4
+    assert [item["vacancy"] for item in page["items"]] == [
+        "Java developer",
+        "Python QA",
+    ]
+    assert page["items"][0] == {
+        "company": "Яндекс",
+        "vacancy": "Java developer",
+        "salary_from": 50000,
+        "salary_to": None,
+        "url": "https://hh.ru/vacancy/2",
+    }
+
+
+def test_get_vacancies_page_past_the_end(db):
+    assert db.get_vacancies_page(10, 10) == {"total": 4, "items": []}
+
+
+async def _get(port, target, headers=""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"GET {target} HTTP/1.1\r\nHost: test\r\n{headers}"
+        f"Connection: close\r\n\r\n".encode()
+    )
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, body = raw.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    response_headers = dict(line.split(": ", 1) for line in lines[1:])
+    return int(lines[0].split()[1]), response_headers, body
+
+
+def test_service_endpoints(db, pg_params):
+    async def scenario():
+        service = QueryService(pool_size=2, cache_ttl=60, db_params=pg_params)
+        service.open_pool()
+        try:
+            server = await asyncio.start_server(service.handle_client, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                status, headers, body = await _get(port, "/companies")
+                assert status == 200
+                assert json.loads(body) == [
+                    {"company": "Ozon", "vacancy_count": 1},
+                    {"company": "Яндекс", "vacancy_count": 3},
+                ]
+
+                status, _, body = await _get(
+                    port, "/companies", f"If-None-Match: {headers['ETag']}\r\n"
+                )
+                assert status == 304
+                assert body == b""
+
+                status, _, body = await _get(port, "/vacancies?limit=1&offset=3")
+                page = json.loads(body)
+                assert page["total"] == 4
+                assert [item["vacancy"] for item in page["items"]] == ["Go developer"]
+
+                _, _, body = await _get(port, "/vacancies/average-salary")
+                assert json.loads(body)["avg_salary"] == pytest.approx(
+                    (150000 + 25000 + 300000) / 3
+                )
+
+                _, _, body = await _get(port, "/vacancies/higher-salary")
+                assert [item["vacancy"] for item in json.loads(body)] == [
+                    "Go developer"
+                ]
+
+                _, _, body = await _get(port, "/vacancies/search?keyword=python")
+                assert sorted(item["vacancy"] for item in json.loads(body)) == [
+                    "Python QA",
+                    "Python developer",
+                ]
+
+                status, _, _ = await _get(port, "/vacancies/search")
+                assert status == 400
+        finally:
+            service.close()
+
+    asyncio.run(scenario())